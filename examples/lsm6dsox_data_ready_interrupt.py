@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import uasyncio as asyncio
+from machine import Pin, I2C
+from micropython_lsm6dsox import lsm6dsox
+
+i2c = I2C(1, sda=Pin(2), scl=Pin(3), freq=400_000)  # Correct I2C pins for RP2040
+lsm = lsm6dsox.LSM6DSOX(i2c)
+
+lsm.acceleration_data_rate = lsm6dsox.RATE_12_5_HZ
+lsm.gyro_data_rate = lsm6dsox.RATE_12_5_HZ
+lsm.attach_data_ready_pin(Pin(4, Pin.IN))  # LSM6DSOX INT1 pin connected to GP4
+
+
+async def main():
+    while True:
+        await lsm.wait_data_ready()
+        (accx, accy, accz), (gyrox, gyroy, gyroz) = lsm.sensor_data
+        print(f"x:{accx:.2f}m/s2, y:{accy:.2f}m/s2, z{accz:.2f}m/s2")
+        print(f"x:{gyrox:.2f}rad/s, y:{gyroy:.2f}rad/s, z{gyroz:.2f}rad/s")
+        print("")
+
+
+asyncio.run(main())
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import time
+from machine import Pin, I2C
+from micropython_lsm6dsox import lsm6dsox
+
+i2c = I2C(1, sda=Pin(2), scl=Pin(3), freq=400_000)  # Correct I2C pins for RP2040
+lsm = lsm6dsox.LSM6DSOX(i2c)
+
+lsm.fifo_mode = lsm6dsox.FIFO_CONTINUOUS
+
+while True:
+    time.sleep(0.25)
+    tags, xs, ys, zs = lsm.read_fifo()
+    print("Words read from the FIFO: ", len(tags))
+    for tag, x, y, z in zip(tags, xs, ys, zs):
+        if tag == lsm6dsox.FIFO_TAG_ACCELERATION:
+            print(f"Acceleration raw x:{x}, y:{y}, z:{z}")
+        elif tag == lsm6dsox.FIFO_TAG_GYRO:
+            print(f"Gyro raw x:{x}, y:{y}, z:{z}")
+    print()
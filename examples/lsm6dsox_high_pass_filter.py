@@ -6,7 +6,7 @@ import time
 from machine import Pin, I2C
 from micropython_lsm6dsox import lsm6dsox
 
-i2c = I2C(1, sda=Pin(2), scl=Pin(3))  # Correct I2C pins for RP2040
+i2c = I2C(1, sda=Pin(2), scl=Pin(3), freq=400_000)  # Correct I2C pins for RP2040
 lsm = lsm6dsox.LSM6DSOX(i2c)
 
 lsm.high_pass_filter = lsm6dsox.HPF_DIV400
@@ -45,6 +45,10 @@ import struct
 class CBits:
     """
     Changes bits from a byte register
+
+    If the device object has a ``_register_shadow`` dict holding the register,
+    its value is used instead of reading the register back, and updated after
+    every write.
     """
 
     def __init__(
@@ -66,6 +70,10 @@ class CBits:
         obj,
         objtype=None,
     ) -> int:
+        shadow = getattr(obj, "_register_shadow", None)
+        if shadow and self.register in shadow:
+            return (shadow[self.register] & self.bit_mask) >> self.star_bit
+
         mem_value = obj._i2c.readfrom_mem(obj._address, self.register, self.lenght)
 
         reg = 0
@@ -80,21 +88,30 @@ class CBits:
         return reg
 
     def __set__(self, obj, value: int) -> None:
-        memory_value = obj._i2c.readfrom_mem(obj._address, self.register, self.lenght)
+        shadow = getattr(obj, "_register_shadow", None)
+        if shadow and self.register in shadow:
+            reg = shadow[self.register]
+        else:
+            memory_value = obj._i2c.readfrom_mem(
+                obj._address, self.register, self.lenght
+            )
 
-        reg = 0
-        order = range(len(memory_value) - 1, -1, -1)
-        if not self.lsb_first:
-            order = range(0, len(memory_value))
-        for i in order:
-            reg = (reg << 8) | memory_value[i]
+            reg = 0
+            order = range(len(memory_value) - 1, -1, -1)
+            if not self.lsb_first:
+                order = range(0, len(memory_value))
+            for i in order:
+                reg = (reg << 8) | memory_value[i]
         reg &= ~self.bit_mask
 
         value <<= self.star_bit
         reg |= value
-        reg = reg.to_bytes(self.lenght, "big")
 
-        obj._i2c.writeto_mem(obj._address, self.register, reg)
+        obj._i2c.writeto_mem(
+            obj._address, self.register, reg.to_bytes(self.lenght, "big")
+        )
+        if shadow and self.register in shadow:
+            shadow[self.register] = reg
 
 
 class RegisterStruct:
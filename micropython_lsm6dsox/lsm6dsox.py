@@ -15,7 +15,15 @@ MicroPython Library for the ST LSM6DSOX accelerometer/gyro Sensor
 """
 
 from time import sleep
-from math import radians
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    pass
+
+from array import array
+from struct import unpack_from
+import micropython
 from micropython import const
 from micropython_lsm6dsox.i2c_helpers import CBits, RegisterStruct
 
@@ -53,20 +61,45 @@ data_rate_values = (
     RATE_6_66K_HZ,
     RATE_1_6_HZ,
 )
+_DATA_RATE_SET = frozenset(data_rate_values)
+_DATA_RATE_HZ = (0, 12.5, 26, 52, 104, 208, 416, 833, 1666, 3333, 6666, 1.6)
+_DATA_RATE_NAMES = (
+    "RATE_SHUTDOWN",
+    "RATE_12_5_HZ",
+    "RATE_26_HZ",
+    "RATE_52_HZ",
+    "RATE_104_HZ",
+    "RATE_208_HZ",
+    "RATE_416_HZ",
+    "RATE_833_HZ",
+    "RATE_1_66K_HZ",
+    "RATE_3_33K_HZ",
+    "RATE_6_66K_HZ",
+    "RATE_1_6_HZ",
+)
 
 RANGE_2G = const(0b00)
 RANGE_4G = const(0b10)
 RANGE_8G = const(0b11)
 RANGE_16G = const(0b01)
 acceleration_range_values = (RANGE_2G, RANGE_16G, RANGE_4G, RANGE_8G)
+_ACCELERATION_RANGE_SET = frozenset(acceleration_range_values)
 acceleration_factor = (0.061, 0.488, 0.122, 0.244)
+_ACCELERATION_RANGE_NAMES = ("RANGE_2G", "RANGE_16G", "RANGE_4G", "RANGE_8G")
 
 RANGE_250_DPS = const(0b00)
 RANGE_500_DPS = const(0b01)
 RANGE_1000_DPS = const(0b10)
 RANGE_2000_DPS = const(0b11)
 gyro_range_values = (RANGE_250_DPS, RANGE_500_DPS, RANGE_1000_DPS, RANGE_2000_DPS)
+_GYRO_RANGE_SET = frozenset(gyro_range_values)
 gyro_factor = (8.75, 17.50, 35.0, 70.0)
+_GYRO_RANGE_NAMES = (
+    "RANGE_250_DPS",
+    "RANGE_500_DPS",
+    "RANGE_1000_DPS",
+    "RANGE_2000_DPS",
+)
 
 SLOPE = const(0b000)
 HPF_DIV10 = const(0b001)
@@ -86,23 +119,81 @@ high_pass_filter_values = (
     HPF_DIV400,
     HPF_DIV800,
 )
+_HIGH_PASS_FILTER_SET = frozenset(high_pass_filter_values)
+_HIGH_PASS_FILTER_NAMES = ("SLOPE", "HPF_DIV100", "HPF_DIV9", "HPF_DIV400")
+
+FIFO_BYPASS = const(0b000)
+FIFO_STOP_WHEN_FULL = const(0b001)
+FIFO_CONTINUOUS = const(0b110)
+fifo_mode_values = (FIFO_BYPASS, FIFO_STOP_WHEN_FULL, FIFO_CONTINUOUS)
+_FIFO_MODE_SET = frozenset(fifo_mode_values)
+# Indexed by the FIFO_MODE field, including modes the driver does not set
+_FIFO_MODE_NAMES = (
+    "FIFO_BYPASS",
+    "FIFO_STOP_WHEN_FULL",
+    "RESERVED",
+    "CONTINUOUS_TO_FIFO",
+    "BYPASS_TO_CONTINUOUS",
+    "RESERVED",
+    "FIFO_CONTINUOUS",
+    "BYPASS_TO_FIFO",
+)
+
+FIFO_TAG_GYRO = const(0x01)
+FIFO_TAG_ACCELERATION = const(0x02)
 
 
-_LSM6DS_MLC_INT1 = const(0x0D)
+_FIFO_CTRL3 = const(0x09)
+_FIFO_CTRL4 = const(0x0A)
+_COUNTER_BDR_REG1 = const(0x0B)
+_INT1_CTRL = const(0x0D)
 _LSM6DS_WHOAMI = const(0xF)
 _CTRL1_XL = const(0x10)
 _CTRL2_G = const(0x11)
 _LSM6DS_CTRL3_C = const(0x12)
 _CTRL8_XL = const(0x17)
+_STATUS_REG = const(0x1E)
 _OUT_TEMP_L = const(0x20)
 _OUTX_L_G = const(0x22)
 _OUTX_L_A = const(0x28)
+_FIFO_STATUS1 = const(0x3A)
+_FIFO_DATA_OUT_TAG = const(0x78)
+_FIFO_WORDS = const(64)
 _MILLI_G_TO_ACCEL = 0.00980665
+_MILLI_DPS_TO_RAD = 0.000017453292519943295
 _TEMPERATURE_SENSITIVITY = 256
 _TEMPERATURE_OFFSET = 25.0
+_RESET_RETRIES = const(50)
+
+
+def _import_asyncio():
+    """Imports asyncio on first use, so synchronous users do not load it"""
+    # pylint: disable=import-outside-toplevel
+    try:
+        import asyncio
+    except ImportError:
+        import uasyncio as asyncio
+    return asyncio
+
 
+@micropython.native
+def _scale_xyz(buffer, offset: int, scale: float) -> Tuple[float, float, float]:
+    """Decodes three little-endian int16 values from ``buffer`` starting
+    at ``offset`` and returns them multiplied by ``scale``"""
+    x = buffer[offset] | buffer[offset + 1] << 8
+    y = buffer[offset + 2] | buffer[offset + 3] << 8
+    z = buffer[offset + 4] | buffer[offset + 5] << 8
+    if x & 0x8000:
+        x -= 0x10000
+    if y & 0x8000:
+        y -= 0x10000
+    if z & 0x8000:
+        z -= 0x10000
 
-class LSM6DSOX:
+    return x * scale, y * scale, z * scale
+
+
+class LSM6DSOX:  # pylint: disable=too-many-public-methods
     """Driver for the LSM6DSOX Sensor connected over I2C.
 
     :param ~machine.I2C i2c: The I2C bus the LSM6DSOX is connected to.
@@ -120,11 +211,13 @@ class LSM6DSOX:
         from machine import Pin, I2C
         from micropython_lsm6dsox import lsm6dsox
 
-    Once this is done you can define your `machine.I2C` object and define your sensor object
+    Once this is done you can define your `machine.I2C` object and define your sensor object.
+    The sensor supports Fast-mode (400 kHz) and Fast-mode Plus (1 MHz) I2C clocks, and
+    reading it is limited by the bus, so use the fastest clock your board allows
 
     .. code-block:: python
 
-        i2c = I2C(1, sda=Pin(2), scl=Pin(3))
+        i2c = I2C(1, sda=Pin(2), scl=Pin(3), freq=400_000)
         lsm6dsox = lsm6dsox.LSM6DSOX(i2c)
 
     Now you have access to the attributes
@@ -135,14 +228,28 @@ class LSM6DSOX:
 
     """
 
+    __slots__ = (
+        "_i2c",
+        "_address",
+        "_read",
+        "_xyz_buffer",
+        "_burst_buffer",
+        "_register_shadow",
+        "_fifo_buffer",
+        "_fifo_data",
+        "_cached_acceleration_range",
+        "_cached_gyro_range",
+        "_accel_scale",
+        "_gyro_scale",
+        "_data_ready_flag",
+    )
+
     _device_id = RegisterStruct(_LSM6DS_WHOAMI, "<b")
-    _raw_accel_data = RegisterStruct(_OUTX_L_A, "<hhh")
-    _raw_gyro_data = RegisterStruct(_OUTX_L_G, "<hhh")
     _raw_temp_data = RegisterStruct(_OUT_TEMP_L, "<h")
 
     _acceleration_range = CBits(2, _CTRL1_XL, 2)
     _acceleration_full_scale = CBits(1, _CTRL8_XL, 1)
-    _acceleration_data_rate = CBits(4, _CTRL1_XL, 2)
+    _acceleration_data_rate = CBits(4, _CTRL1_XL, 4)
 
     _gyro_data_rate = CBits(4, _CTRL2_G, 4)
     _gyro_range = CBits(2, _CTRL2_G, 2)
@@ -152,9 +259,24 @@ class LSM6DSOX:
     _high_pass_filter = CBits(2, _CTRL8_XL, 5)
     _block_data_enable = CBits(1, _LSM6DS_CTRL3_C, 4)
 
+    _int1_data_ready = CBits(2, _INT1_CTRL, 0)
+    _data_ready_pulsed = CBits(1, _COUNTER_BDR_REG1, 7)
+    _data_ready_status = CBits(2, _STATUS_REG, 0)
+
+    _fifo_batch_rates = CBits(8, _FIFO_CTRL3, 0)
+    _fifo_mode = CBits(3, _FIFO_CTRL4, 0)
+    _fifo_status = RegisterStruct(_FIFO_STATUS1, "<H")
+
     def __init__(self, i2c, address: int = 0x6A) -> None:
         self._i2c = i2c
         self._address = address
+        self._read = i2c.readfrom_mem_into
+        self._xyz_buffer = bytearray(6)
+        self._burst_buffer = bytearray(14)
+        self._register_shadow = {}
+        self._fifo_buffer = None
+        self._fifo_data = None
+        self._data_ready_flag = None
 
         if self._device_id != 0x6C:
             raise RuntimeError("Failed to find LSM6DSOX")
@@ -165,44 +287,229 @@ class LSM6DSOX:
         self._acceleration_full_scale = False
         self._acceleration_data_rate = RATE_104_HZ
         self._gyro_data_rate = RATE_104_HZ
-        self.acceleration_range = RANGE_4G
-        self.gyro_range = RANGE_250_DPS
+        self._set_acceleration_range(RANGE_4G)
+        self._set_gyro_range(RANGE_250_DPS)
+        self._settle(RATE_104_HZ)
 
     def reset(self) -> None:
-        """Resets the sensor's configuration into an initial state"""
+        """Resets the sensor's configuration into an initial state
+
+        :raises RuntimeError: if the sensor does not finish the reset
+        """
         self._sw_reset = True
-        while self._sw_reset:
-            sleep(0.001)
+        for _ in range(_RESET_RETRIES):
+            if not self._i2c.readfrom_mem(self._address, _LSM6DS_CTRL3_C, 1)[0] & 0x01:
+                break
+        else:
+            raise RuntimeError("LSM6DSOX reset timeout")
+
+        # The reset also clears the INT1 routing set by attach_data_ready_pin
+        self._data_ready_flag = None
+
+        # These registers only change when written by this driver, so keep a copy
+        # of them to avoid reading them back on every setting change
+        control = self._i2c.readfrom_mem(self._address, _CTRL1_XL, 8)
+        self._register_shadow = {
+            _CTRL1_XL: control[0],
+            _CTRL2_G: control[_CTRL2_G - _CTRL1_XL],
+            _CTRL8_XL: control[_CTRL8_XL - _CTRL1_XL],
+        }
+
+    @staticmethod
+    def _slower_rate(first: int, second: int) -> int:
+        """Returns the slower of two data rates, ignoring powered down outputs"""
+        if first == RATE_SHUTDOWN or (
+            second != RATE_SHUTDOWN and _DATA_RATE_HZ[second] < _DATA_RATE_HZ[first]
+        ):
+            return second
+        return first
+
+    @staticmethod
+    def _settle(data_rate: int) -> None:
+        """Waits 3/ODR for the output to settle after a configuration change"""
+        if data_rate != RATE_SHUTDOWN:
+            sleep(max(3 / _DATA_RATE_HZ[data_rate], 0.001))
+
+    def configure(
+        self,
+        acceleration_range: int = None,
+        gyro_range: int = None,
+        acceleration_data_rate: int = None,
+        gyro_data_rate: int = None,
+    ) -> None:
+        """
+        Changes several settings at once and waits for the output to settle
+        only once, instead of once per setting. Settings left as `None` are
+        not changed. If the FIFO is enabled, its batch data rates follow the
+        new output data rates.
+
+        :raises ValueError: if any of the given settings is not valid
+        """
+        if (
+            acceleration_range is not None
+            and acceleration_range not in _ACCELERATION_RANGE_SET
+        ):
+            raise ValueError("Value must be a valid acceleration_range setting")
+        if gyro_range is not None and gyro_range not in _GYRO_RANGE_SET:
+            raise ValueError("Value must be a valid gyro_range setting")
+        if (
+            acceleration_data_rate is not None
+            and acceleration_data_rate not in _DATA_RATE_SET
+        ):
+            raise ValueError("Value must be a valid acceleration_data_rate setting")
+        if gyro_data_rate is not None and gyro_data_rate not in _DATA_RATE_SET:
+            raise ValueError("Value must be a valid gyro_data_rate setting")
+
+        if acceleration_data_rate is not None:
+            self._acceleration_data_rate = acceleration_data_rate
+        if gyro_data_rate is not None:
+            self._gyro_data_rate = gyro_data_rate
+        if acceleration_range is not None:
+            self._set_acceleration_range(acceleration_range)
+        if gyro_range is not None:
+            self._set_gyro_range(gyro_range)
+
+        accel_rate = self._acceleration_data_rate
+        gyro_rate = self._gyro_data_rate
+        if (
+            acceleration_data_rate is not None or gyro_data_rate is not None
+        ) and self._fifo_mode != FIFO_BYPASS:
+            self._fifo_batch_rates = gyro_rate << 4 | accel_rate
+
+        # Wait for the slower output among the sensors that changed
+        if acceleration_range is None and acceleration_data_rate is None:
+            accel_rate = RATE_SHUTDOWN
+        if gyro_range is None and gyro_data_rate is None:
+            gyro_rate = RATE_SHUTDOWN
+        self._settle(self._slower_rate(accel_rate, gyro_rate))
+
+    def _set_acceleration_range(self, value: int) -> None:
+        """Writes the acceleration range and its scale without validation"""
+        self._acceleration_range = value
+        self._cached_acceleration_range = value
+        self._accel_scale = acceleration_factor[value] * _MILLI_G_TO_ACCEL
+
+    def _set_gyro_range(self, value: int) -> None:
+        """Writes the gyro range and its scale without validation"""
+        self._gyro_range = value
+        self._cached_gyro_range = value
+        self._gyro_scale = gyro_factor[value] * _MILLI_DPS_TO_RAD
 
     @property
     def acceleration(self) -> Tuple[float, float, float]:
         """
         The x, y, z acceleration values returned in a 3-tuple and are in m / s ^ 2.
         """
-        rawx, rawy, rawz = self._raw_accel_data
+        self._read(self._address, _OUTX_L_A, self._xyz_buffer)
+        return _scale_xyz(self._xyz_buffer, 0, self._accel_scale)
+
+    def fill(self, x_values, y_values, z_values, samples: int) -> None:
+        """
+        Fills ``x_values``, ``y_values`` and ``z_values`` with ``samples``
+        consecutive x, y, z acceleration values in m / s ^ 2, waiting for each
+        new sample.
 
-        x = rawx * self._cached_conversion_factor * _MILLI_G_TO_ACCEL
-        y = rawy * self._cached_conversion_factor * _MILLI_G_TO_ACCEL
-        z = rawz * self._cached_conversion_factor * _MILLI_G_TO_ACCEL
+        The buffers must be preallocated, for example ``array("f", ...)``
+        with at least ``samples`` items, so the samples are stored unboxed with
+        one array per axis.
 
-        return x, y, z
+        :raises RuntimeError: if the accelerometer is powered down or a new
+         sample does not arrive within two output data periods
+        """
+        data_rate = self._acceleration_data_rate
+        if data_rate == RATE_SHUTDOWN:
+            raise RuntimeError("LSM6DSOX accelerometer is powered down")
+        # Poll without sleeping, so no sample is missed at high data rates
+        timeout = int(2_000_000 / _DATA_RATE_HZ[data_rate])
+
+        read = self._read
+        address = self._address
+        buffer = self._xyz_buffer
+        status = memoryview(buffer)[:1]
+        scale = self._accel_scale
+        for i in range(samples):
+            start = ticks_us()
+            read(address, _STATUS_REG, status)
+            while not status[0] & 0x01:
+                if ticks_diff(ticks_us(), start) > timeout:
+                    raise RuntimeError("LSM6DSOX data ready timeout")
+                read(address, _STATUS_REG, status)
+            read(address, _OUTX_L_A, buffer)
+            x_values[i], y_values[i], z_values[i] = _scale_xyz(buffer, 0, scale)
 
     @property
     def gyro(self) -> Tuple[float, float, float]:
         """
         The x, y, z angular velocity values returned in a 3-tuple and are in radians / second
         """
-        rawx, rawy, rawz = self._raw_gyro_data
-        x = radians(rawx * self._gyro_cached_conversion_factor / 1000)
-        y = radians(rawy * self._gyro_cached_conversion_factor / 1000)
-        z = radians(rawz * self._gyro_cached_conversion_factor / 1000)
+        self._read(self._address, _OUTX_L_G, self._xyz_buffer)
+        return _scale_xyz(self._xyz_buffer, 0, self._gyro_scale)
+
+    @property
+    def raw_acceleration(self) -> Tuple[int, int, int]:
+        """
+        The x, y, z acceleration values returned in a 3-tuple as raw signed
+        16-bit sensor counts, without float scaling. Useful for fixed-point
+        processing. The size of one count depends on :attr:`acceleration_range`.
+        """
+        self._read(self._address, _OUTX_L_A, self._xyz_buffer)
+        return unpack_from("<hhh", self._xyz_buffer)
+
+    @property
+    def raw_gyro(self) -> Tuple[int, int, int]:
+        """
+        The x, y, z angular velocity values returned in a 3-tuple as raw signed
+        16-bit sensor counts, without float scaling. Useful for fixed-point
+        processing. The size of one count depends on :attr:`gyro_range`.
+        """
+        self._read(self._address, _OUTX_L_G, self._xyz_buffer)
+        return unpack_from("<hhh", self._xyz_buffer)
+
+    @property
+    def sensor_data(
+        self,
+    ) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+        """
+        The acceleration and angular velocity values returned in a 2-tuple
+        ``(acceleration, gyro)``, using the same units as :attr:`acceleration`
+        and :attr:`gyro`. Both are read in a single I2C transaction, as the gyro
+        and accelerometer output registers are contiguous. Block Data Update is
+        enabled so both belong to the same sample.
+        """
+        self._read(self._address, _OUT_TEMP_L, self._burst_buffer)
+        return _scale_xyz(self._burst_buffer, 8, self._accel_scale), _scale_xyz(
+            self._burst_buffer, 2, self._gyro_scale
+        )
 
-        return x, y, z
+    def read_all(self) -> Tuple[float, float, float, float, float, float, float]:
+        """
+        Reads acceleration, angular velocity and temperature in a single I2C
+        transaction, as their output registers are contiguous. Returns a
+        7-tuple ``(accx, accy, accz, gyrox, gyroy, gyroz, temperature)`` using
+        the same units as :attr:`acceleration`, :attr:`gyro` and
+        :attr:`temperature`.
+        """
+        buffer = self._burst_buffer
+        self._read(self._address, _OUT_TEMP_L, buffer)
+        accx, accy, accz = _scale_xyz(buffer, 8, self._accel_scale)
+        gyrox, gyroy, gyroz = _scale_xyz(buffer, 2, self._gyro_scale)
+        temp = unpack_from("<h", buffer)[0]
+
+        return (
+            accx,
+            accy,
+            accz,
+            gyrox,
+            gyroy,
+            gyroz,
+            temp / _TEMPERATURE_SENSITIVITY + _TEMPERATURE_OFFSET,
+        )
 
     @property
     def acceleration_range(self) -> int:
         """
-        Sensor acceleration_range
+        Sensor acceleration_range. Setting it waits three output data periods
+        (3/ODR) for the output to settle.
 
         +--------------------------------+------------------+
         | Mode                           | Value            |
@@ -216,22 +523,20 @@ class LSM6DSOX:
         | :py:const:`lsm6dsox.RANGE_16G` | :py:const:`0b01` |
         +--------------------------------+------------------+
         """
-        values = ("RANGE_2G", "RANGE_16G", "RANGE_4G", "RANGE_8G")
-        return values[self._cached_acceleration_range]
+        return _ACCELERATION_RANGE_NAMES[self._cached_acceleration_range]
 
     @acceleration_range.setter
     def acceleration_range(self, value: int) -> None:
-        if value not in acceleration_range_values:
+        if value not in _ACCELERATION_RANGE_SET:
             raise ValueError("Value must be a valid acceleration_range setting")
-        self._acceleration_range = value
-        self._cached_acceleration_range = value
-        self._cached_conversion_factor = acceleration_factor[value]
-        sleep(0.2)
+        self._set_acceleration_range(value)
+        self._settle(self._acceleration_data_rate)
 
     @property
     def gyro_range(self) -> int:
         """
-        Sensor gyro_range
+        Sensor gyro_range. Setting it waits three output data periods
+        (3/ODR) for the output to settle.
 
         +-------------------------------------+------------------+
         | Mode                                | Value            |
@@ -245,23 +550,20 @@ class LSM6DSOX:
         | :py:const:`lsm6dsox.RANGE_2000_DPS` | :py:const:`0b11` |
         +-------------------------------------+------------------+
         """
-        values = ("RANGE_250_DPS", "RANGE_500_DPS", "RANGE_1000_DPS", "RANGE_2000_DPS")
-
-        return values[self._cached_gyro_range]
+        return _GYRO_RANGE_NAMES[self._cached_gyro_range]
 
     @gyro_range.setter
     def gyro_range(self, value: int) -> None:
-        if value not in gyro_range_values:
+        if value not in _GYRO_RANGE_SET:
             raise ValueError("Value must be a valid gyro_range setting")
-
-        self._cached_gyro_range = value
-        self._gyro_cached_conversion_factor = gyro_factor[value]
-        sleep(0.2)
+        self._set_gyro_range(value)
+        self._settle(self._gyro_data_rate)
 
     @property
     def acceleration_data_rate(self) -> str:
         """
-        Sensor acceleration_data_rate
+        Sensor acceleration_data_rate. Setting it waits three output data periods
+        (3/ODR) for the output to settle.
 
         +------------------------------------+--------------------+
         | Mode                               | Value              |
@@ -291,28 +593,14 @@ class LSM6DSOX:
         | :py:const:`lsm6dsox.RATE_1_6_HZ`   | :py:const:`0b1011` |
         +------------------------------------+--------------------+
         """
-        values = (
-            "RATE_SHUTDOWN",
-            "RATE_12_5_HZ",
-            "RATE_26_HZ",
-            "RATE_52_HZ",
-            "RATE_104_HZ",
-            "RATE_208_HZ",
-            "RATE_416_HZ",
-            "RATE_833_HZ",
-            "RATE_1_66K_HZ",
-            "RATE_3_33K_HZ",
-            "RATE_6_66K_HZ",
-            "RATE_1_6_HZ",
-        )
-        return values[self._acceleration_data_rate]
+        return _DATA_RATE_NAMES[self._acceleration_data_rate]
 
     @acceleration_data_rate.setter
     def acceleration_data_rate(self, value: int) -> None:
-        if value not in data_rate_values:
+        if value not in _DATA_RATE_SET:
             raise ValueError("Value must be a valid acceleration_data_rate setting")
         self._acceleration_data_rate = value
-        sleep(0.2)
+        self._settle(value)
 
     @property
     def gyro_data_rate(self) -> str:
@@ -347,25 +635,11 @@ class LSM6DSOX:
         | :py:const:`lsm6dsox.RATE_1_6_HZ`   | :py:const:`0b1011` |
         +------------------------------------+--------------------+
         """
-        values = (
-            "RATE_SHUTDOWN",
-            "RATE_12_5_HZ",
-            "RATE_26_HZ",
-            "RATE_52_HZ",
-            "RATE_104_HZ",
-            "RATE_208_HZ",
-            "RATE_416_HZ",
-            "RATE_833_HZ",
-            "RATE_1_66K_HZ",
-            "RATE_3_33K_HZ",
-            "RATE_6_66K_HZ",
-            "RATE_1_6_HZ",
-        )
-        return values[self._gyro_data_rate]
+        return _DATA_RATE_NAMES[self._gyro_data_rate]
 
     @gyro_data_rate.setter
     def gyro_data_rate(self, value: int) -> None:
-        if value not in data_rate_values:
+        if value not in _DATA_RATE_SET:
             raise ValueError("Value must be a valid gyro_data_rate setting")
         self._gyro_data_rate = value
 
@@ -386,12 +660,11 @@ class LSM6DSOX:
         | :py:const:`lsm6dsox.HPF_DIV400` | :py:const:`0b00` |
         +---------------------------------+------------------+
         """
-        values = ("SLOPE", "HPF_DIV100", "HPF_DIV9", "HPF_DIV400")
-        return values[self._high_pass_filter]
+        return _HIGH_PASS_FILTER_NAMES[self._high_pass_filter]
 
     @high_pass_filter.setter
     def high_pass_filter(self, value: int) -> None:
-        if value not in high_pass_filter_values:
+        if value not in _HIGH_PASS_FILTER_SET:
             raise ValueError("Value must be a valid high_pass_filter setting")
         self._high_pass_filter = value
 
@@ -399,6 +672,181 @@ class LSM6DSOX:
     def temperature(self) -> float:
         """Temperature in Celsius"""
 
-        temp = self._raw_temp_data[0]
+        temp = self._raw_temp_data
 
         return temp / _TEMPERATURE_SENSITIVITY + _TEMPERATURE_OFFSET
+
+    @property
+    def data_ready(self) -> bool:
+        """
+        True when both a new acceleration and a new gyro sample are available
+        """
+        return self._data_ready_status == 0b11
+
+    @property
+    def data_ready_int1(self) -> bool:
+        """
+        Routes the acceleration and gyro data ready signals to the INT1 pin.
+        The pin goes high when a new sample is available and returns low once
+        it is read, or pulses instead after :meth:`attach_data_ready_pin`, so
+        it can be used with :meth:`machine.Pin.irq` instead of polling the
+        sensor.
+        """
+        return self._int1_data_ready == 0b11
+
+    @data_ready_int1.setter
+    def data_ready_int1(self, value: bool) -> None:
+        self._int1_data_ready = 0b11 if value else 0b00
+
+    def attach_data_ready_pin(self, pin) -> None:
+        """
+        Routes the data ready signals to INT1 in pulsed mode, and sets up a
+        rising edge interrupt on ``pin``, the `machine.Pin` wired to INT1, so
+        :meth:`wait_data_ready` sleeps until a new sample instead of polling.
+        Calling :meth:`reset` detaches the pin.
+        """
+        flag = _import_asyncio().ThreadSafeFlag()
+        self._data_ready_pulsed = True
+        self.data_ready_int1 = True
+        pin.irq(lambda _: flag.set(), pin.IRQ_RISING)
+        self._data_ready_flag = flag
+
+    async def _wait_status(self, mask: int) -> None:
+        """Waits until all the data ready bits in ``mask`` are set
+
+        :raises RuntimeError: if a sensor in ``mask`` is powered down, or when
+         polling, if no sample arrives within three output data periods
+        """
+        accel_rate = self._acceleration_data_rate if mask & 0b01 else None
+        gyro_rate = self._gyro_data_rate if mask & 0b10 else None
+        if accel_rate == RATE_SHUTDOWN:
+            raise RuntimeError("LSM6DSOX accelerometer is powered down")
+        if gyro_rate == RATE_SHUTDOWN:
+            raise RuntimeError("LSM6DSOX gyro is powered down")
+
+        flag = self._data_ready_flag
+        if flag is not None:
+            # INT1 pulses for either sensor, so check which one is ready
+            while self._data_ready_status & mask != mask:
+                await flag.wait()
+            return
+
+        slowest = self._slower_rate(
+            RATE_SHUTDOWN if accel_rate is None else accel_rate,
+            RATE_SHUTDOWN if gyro_rate is None else gyro_rate,
+        )
+        asyncio = _import_asyncio()
+        # Poll every millisecond for up to three output data periods
+        for _ in range(int(3000 / _DATA_RATE_HZ[slowest]) + 2):
+            if self._data_ready_status & mask == mask:
+                return
+            await asyncio.sleep_ms(1)
+        raise RuntimeError("LSM6DSOX data ready timeout")
+
+    async def wait_data_ready(self) -> None:
+        """
+        Waits until both a new acceleration and a new gyro sample are
+        available, letting other tasks run meanwhile. Uses the INT1 interrupt
+        when :meth:`attach_data_ready_pin` was called, otherwise polls the
+        sensor every millisecond.
+
+        :raises RuntimeError: if a sensor is powered down, or when polling, if
+         no sample arrives within three output data periods
+        """
+        await self._wait_status(0b11)
+
+    async def acceleration_async(self) -> Tuple[float, float, float]:
+        """
+        Waits for a new acceleration sample, letting other tasks run
+        meanwhile, and returns :attr:`acceleration`
+        """
+        await self._wait_status(0b01)
+        return self.acceleration
+
+    async def gyro_async(self) -> Tuple[float, float, float]:
+        """
+        Waits for a new gyro sample, letting other tasks run meanwhile, and
+        returns :attr:`gyro`
+        """
+        await self._wait_status(0b10)
+        return self.gyro
+
+    @property
+    def fifo_mode(self) -> str:
+        """
+        FIFO operating mode. When enabled, acceleration and gyro samples are
+        batched into the FIFO at their current data rates, so set the data
+        rates first. Read the batched samples with :meth:`read_fifo`.
+
+        +------------------------------------------+-------------------+
+        | Mode                                     | Value             |
+        +==========================================+===================+
+        | :py:const:`lsm6dsox.FIFO_BYPASS`         | :py:const:`0b000` |
+        +------------------------------------------+-------------------+
+        | :py:const:`lsm6dsox.FIFO_STOP_WHEN_FULL` | :py:const:`0b001` |
+        +------------------------------------------+-------------------+
+        | :py:const:`lsm6dsox.FIFO_CONTINUOUS`     | :py:const:`0b110` |
+        +------------------------------------------+-------------------+
+        """
+        return _FIFO_MODE_NAMES[self._fifo_mode]
+
+    @fifo_mode.setter
+    def fifo_mode(self, value: int) -> None:
+        if value not in _FIFO_MODE_SET:
+            raise ValueError("Value must be a valid fifo_mode setting")
+        if value != FIFO_BYPASS:
+            # The batch data rate codes match the output data rate codes
+            self._fifo_batch_rates = (
+                self._gyro_data_rate << 4 | self._acceleration_data_rate
+            )
+        self._fifo_mode = value
+
+    @property
+    def fifo_words(self) -> int:
+        """Number of unread words stored in the FIFO"""
+        return self._fifo_status & 0x3FF
+
+    def read_fifo(
+        self, words: int = 64
+    ) -> Tuple[memoryview, memoryview, memoryview, memoryview]:
+        """
+        Reads up to ``words`` words from the FIFO, at most 64, in a single
+        I2C transaction. Each word holds either an acceleration or a gyro
+        sample, so one sample of both takes two words.
+
+        Returns four views of the same length: the word tags, either
+        :py:const:`lsm6dsox.FIFO_TAG_GYRO` or
+        :py:const:`lsm6dsox.FIFO_TAG_ACCELERATION`, and the raw x, y, z
+        values. The views point into buffers reused on every call, so copy
+        them if they need to outlive the next read.
+        """
+        if self._fifo_buffer is None:
+            self._fifo_buffer = bytearray(7 * _FIFO_WORDS)
+            self._fifo_data = (
+                bytearray(_FIFO_WORDS),
+                array("h", [0] * _FIFO_WORDS),
+                array("h", [0] * _FIFO_WORDS),
+                array("h", [0] * _FIFO_WORDS),
+            )
+        tags, x, y, z = self._fifo_data
+
+        count = max(0, min(words, self.fifo_words, _FIFO_WORDS))
+        if count:
+            # The FIFO output address wraps from 0x7E back to 0x78, so all
+            # words are read in one burst
+            buffer = self._fifo_buffer
+            self._read(
+                self._address,
+                _FIFO_DATA_OUT_TAG,
+                memoryview(buffer)[: 7 * count],
+            )
+            for i in range(count):
+                tags[i] = buffer[7 * i] >> 3
+                x[i], y[i], z[i] = unpack_from("<hhh", buffer, 7 * i + 1)
+
+        return (
+            memoryview(tags)[:count],
+            memoryview(x)[:count],
+            memoryview(y)[:count],
+            memoryview(z)[:count],
+        )